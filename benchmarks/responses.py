@@ -0,0 +1,152 @@
+"""Micro-benchmark for API response serialization and compression.
+
+Measures server CPU time per request and bytes on the wire for the main
+endpoints, by calling the ASGI app directly (no network and no client
+decoding), plus the serialization cost of FastAPI's default JSON path
+versus FastJSONResponse.
+
+Usage: python -m benchmarks.responses [--projects 200] [--functions 20]
+"""
+
+import argparse
+import asyncio
+import json
+import time
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from rich.console import Console
+from rich.table import Table
+
+import src.generator as generator
+from src.api.main import app
+from src.api.responses import FastJSONResponse, brotli
+from src.core.schemas import ProjectRecord
+
+console = Console()
+
+
+def seed_projects(projects: int, functions: int) -> str:
+    """Fill the project store with synthetic projects, returning one ID."""
+    for i in range(projects):
+        generator._projects[f"{i:08x}"] = ProjectRecord(
+            name=f"tool-{i}",
+            description="A synthetic tool used to benchmark API responses",
+            tools=[
+                {
+                    "name": f"function_{j}",
+                    "description": "Look up something useful for an AI agent " * 3,
+                    "parameters": {
+                        "type": "object",
+                        "properties": {
+                            "query": {"type": "string", "description": "What to look up"},
+                            "limit": {"type": "integer", "description": "Maximum results"},
+                        },
+                        "required": ["query"],
+                    },
+                }
+                for j in range(functions)
+            ],
+            files=["src/api/main.py", "mcp/server.py", "README.md"],
+            created_at="2026-01-01T00:00:00",
+            path=f"generated/tool-{i}-{i:08x}",
+        )
+    return f"{0:08x}"
+
+
+async def call_app(path: str, encoding: str) -> bytes:
+    """Call the ASGI app directly, returning the body as sent on the wire."""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"bench"), (b"accept-encoding", encoding.encode())],
+        "client": ("127.0.0.1", 0),
+        "server": ("bench", 80),
+    }
+    body = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.body":
+            body.append(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return b"".join(body)
+
+
+async def measure_endpoint(path: str, encoding: str, iterations: int) -> tuple[float, int]:
+    """Return (server CPU microseconds per request, response bytes on the wire)."""
+    size = len(await call_app(path, encoding))
+
+    start = time.process_time()
+    for _ in range(iterations):
+        await call_app(path, encoding)
+    cpu = (time.process_time() - start) / iterations * 1_000_000
+    return cpu, size
+
+
+def measure_serializer(payload: dict, iterations: int) -> tuple[float, float]:
+    """Return CPU microseconds for (default FastAPI path, FastJSONResponse)."""
+    start = time.process_time()
+    for _ in range(iterations):
+        JSONResponse(jsonable_encoder(payload))
+    default = (time.process_time() - start) / iterations * 1_000_000
+
+    start = time.process_time()
+    for _ in range(iterations):
+        FastJSONResponse(payload)
+    fast = (time.process_time() - start) / iterations * 1_000_000
+    return default, fast
+
+
+async def run(projects: int, functions: int, iterations: int) -> None:
+    project_id = seed_projects(projects, functions)
+    endpoints = [
+        "/tools",
+        f"/tools/{project_id}",
+        f"/tools/{project_id}/schema/combined",
+    ]
+    encodings = ["identity", "gzip"] + (["br"] if brotli is not None else [])
+
+    table = Table(title=f"Responses ({projects} projects, {functions} functions each)")
+    table.add_column("Endpoint", style="cyan")
+    table.add_column("Encoding")
+    table.add_column("Server CPU/request (µs)", justify="right")
+    table.add_column("Bytes", justify="right")
+    for url in endpoints:
+        for encoding in encodings:
+            cpu, size = await measure_endpoint(url, encoding, iterations)
+            table.add_row(url, encoding, f"{cpu:.0f}", f"{size:,}")
+    console.print(table)
+
+    table = Table(title="Serialization only")
+    table.add_column("Endpoint", style="cyan")
+    table.add_column("jsonable_encoder + json (µs)", justify="right")
+    table.add_column("FastJSONResponse (µs)", justify="right")
+    for url in endpoints:
+        payload = json.loads(await call_app(url, "identity"))
+        default, fast = measure_serializer(payload, iterations)
+        table.add_row(url, f"{default:.0f}", f"{fast:.0f}")
+    console.print(table)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--projects", type=int, default=200)
+    parser.add_argument("--functions", type=int, default=20)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+    asyncio.run(run(args.projects, args.functions, args.iterations))
+
+
+if __name__ == "__main__":
+    main()
@@ -3,12 +3,14 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from src.api.responses import CompressionMiddleware, FastJSONResponse
 from src.api.routes import generate, tools
 
 app = FastAPI(
     title="AgentKit",
     description="Generate backend tools for AI agents",
     version="0.1.0",
+    default_response_class=FastJSONResponse,
 )
 
 # CORS middleware
@@ -20,6 +22,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress large responses (gzip, or brotli when installed)
+app.add_middleware(CompressionMiddleware, minimum_size=1024)
+
 # Include routers
 app.include_router(generate.router, tags=["generate"])
 app.include_router(tools.router, tags=["tools"])
@@ -0,0 +1,152 @@
+"""Fast JSON responses and response compression."""
+
+import gzip
+from typing import Any
+
+import orjson
+from pydantic import BaseModel
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # Optional: install agentkit[brotli]
+    brotli = None
+
+
+def _default(obj: Any) -> Any:
+    """Serialize pydantic models nested in otherwise plain payloads.
+
+    This is a fallback that builds intermediate dicts; wrap payloads in a
+    model instead to serialize them directly with `model_dump_json`.
+    """
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def dumps(content: Any) -> bytes:
+    """Serialize content to JSON bytes.
+
+    Pydantic models are serialized directly with `model_dump_json`;
+    everything else goes through orjson.
+    """
+    if isinstance(content, BaseModel):
+        return content.model_dump_json().encode()
+    return orjson.dumps(content, default=_default)
+
+
+class FastJSONResponse(Response):
+    """JSON response serialized with orjson or `model_dump_json`.
+
+    Return it from a route to skip FastAPI's `jsonable_encoder` pass.
+    """
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def _parse_accept_encoding(accept_encoding: str) -> dict[str, float]:
+    """Parse an Accept-Encoding header into {coding: q}."""
+    codings = {}
+    for part in accept_encoding.split(","):
+        coding, *params = (p.strip() for p in part.split(";"))
+        if not coding:
+            continue
+        q = 1.0
+        for param in params:
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        codings[coding.lower()] = q
+    return codings
+
+
+def _negotiate_encoding(accept_encoding: str) -> str | None:
+    """Pick brotli or gzip from an Accept-Encoding header, honouring `*`."""
+    codings = _parse_accept_encoding(accept_encoding)
+
+    def accepts(coding: str) -> bool:
+        return codings.get(coding, codings.get("*", 0.0)) > 0
+
+    if brotli is not None and accepts("br"):
+        return "br"
+    if accepts("gzip"):
+        return "gzip"
+    return None
+
+
+def _compress(body: bytes, encoding: str) -> bytes:
+    """Compress a response body with the negotiated encoding."""
+    if encoding == "br":
+        return brotli.compress(body, quality=4)
+    return gzip.compress(body, compresslevel=6)
+
+
+class CompressionMiddleware:
+    """Compress responses with brotli or gzip, as negotiated by the client.
+
+    Only complete bodies of at least `minimum_size` bytes are compressed.
+    Streaming responses (e.g. SSE events) are passed through unchanged so
+    events reach the client as soon as they are sent.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = _negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message: Message | None = None
+        passthrough = False
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal start_message, passthrough
+
+            if message["type"] == "http.response.start":
+                # Hold the headers until we know whether the body is compressed
+                start_message = message
+                return
+            if passthrough:
+                await send(message)
+                return
+            if message["type"] != "http.response.body":
+                # e.g. http.response.pathsend: send the held headers first
+                passthrough = True
+                await send(start_message)
+                await send(message)
+                return
+
+            headers = MutableHeaders(raw=start_message["headers"])
+            body = message.get("body", b"")
+            if (
+                message.get("more_body", False)
+                or len(body) < self.minimum_size
+                or "content-encoding" in headers
+            ):
+                passthrough = True
+                await send(start_message)
+                await send(message)
+                return
+
+            body = _compress(body, encoding)
+            headers["Content-Encoding"] = encoding
+            headers["Content-Length"] = str(len(body))
+            headers.add_vary_header("Accept-Encoding")
+            await send(start_message)
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, send_compressed)
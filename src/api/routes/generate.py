@@ -1,11 +1,12 @@
 """Generation endpoint with SSE streaming."""
 
-import json
 import asyncio
 from fastapi import APIRouter, HTTPException
 from sse_starlette.sse import EventSourceResponse
 
-from src.core.schemas import GenerateRequest
+from src.api.responses import FastJSONResponse, dumps
+from src.core.gemini import get_policy_stats
+from src.core.schemas import GenerateRequest, GenerationStats
 from src.generator import generate_tool
 
 router = APIRouter()
@@ -17,21 +18,21 @@ async def generation_stream(request: GenerateRequest):
         # Planning event
         yield {
             "event": "planning",
-            "data": json.dumps({
+            "data": dumps({
                 "step": "Analyzing requirements",
                 "description": request.description,
                 "requirements": request.requirements,
-            })
+            }).decode()
         }
         await asyncio.sleep(0.5)
 
         # Generating event
         yield {
             "event": "generating",
-            "data": json.dumps({
+            "data": dumps({
                 "step": "Generating code with Gemini 3 Pro",
                 "progress": 0.3,
-            })
+            }).decode()
         }
 
         # Actually generate the tool
@@ -44,29 +45,29 @@ async def generation_stream(request: GenerateRequest):
         # Progress update
         yield {
             "event": "generating",
-            "data": json.dumps({
+            "data": dumps({
                 "step": "Writing files",
                 "progress": 0.8,
-            })
+            }).decode()
         }
         await asyncio.sleep(0.3)
 
         # Complete event
         yield {
             "event": "complete",
-            "data": json.dumps({
+            "data": dumps({
                 "project_id": project_id,
                 "name": tool.name,
                 "description": tool.description,
                 "tools": tool.tools,
                 "files": [f.path for f in tool.files],
-            })
+            }).decode()
         }
 
     except Exception as e:
         yield {
             "event": "error",
-            "data": json.dumps({"error": str(e)})
+            "data": dumps({"error": str(e)}).decode()
         }
 
 
@@ -85,12 +86,18 @@ async def generate_sync(request: GenerateRequest):
             name=request.name,
             requirements=request.requirements,
         )
-        return {
+        return FastJSONResponse({
             "project_id": project_id,
             "name": tool.name,
             "description": tool.description,
             "tools": tool.tools,
             "files": [f.path for f in tool.files],
-        }
+        })
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/generate/stats")
+async def generation_stats():
+    """Get win rates and cost statistics for each generation policy."""
+    return FastJSONResponse(GenerationStats(policies=get_policy_stats()))
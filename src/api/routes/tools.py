@@ -1,9 +1,14 @@
 """Tools management endpoints."""
 
+from pathlib import Path
+
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import PlainTextResponse
 
-from src.generator import get_project, list_projects, get_schema
-from src.core.schemas import SchemaFormat
+from src.api.responses import FastJSONResponse
+from src.bench import load_bench_results
+from src.generator import get_project, list_projects, get_schema, read_project_file
+from src.core.schemas import SchemaFormat, ToolDetail, ToolList
 
 router = APIRouter()
 
@@ -11,26 +16,43 @@ router = APIRouter()
 @router.get("/tools")
 async def list_all_tools():
     """List all generated tools."""
-    return {"tools": list_projects()}
+    return FastJSONResponse(ToolList(tools=list_projects()))
 
 
 @router.get("/tools/{project_id}")
-async def get_tool(project_id: str):
-    """Get details of a generated tool."""
+def get_tool(project_id: str):
+    """Get details of a generated tool.
+
+    Sync so FastAPI runs the benchmark results read in its threadpool.
+    """
     project = get_project(project_id)
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
 
-    tool = project["tool"]
-    return {
-        "project_id": project_id,
-        "name": tool.name,
-        "description": tool.description,
-        "tools": tool.tools,
-        "files": [f.path for f in tool.files],
-        "created_at": project["created_at"],
-        "path": project["path"],
-    }
+    return FastJSONResponse(ToolDetail(
+        project_id=project_id,
+        name=project.name,
+        description=project.description,
+        tools=project.tools,
+        files=[str(Path(project.path) / f) for f in project.files],
+        relative_files=project.files,
+        created_at=project.created_at,
+        path=project.path,
+        bench=load_bench_results(Path(project.path)),
+    ))
+
+
+@router.get("/tools/{project_id}/files/{path:path}", response_class=PlainTextResponse)
+def get_tool_file(project_id: str, path: str):
+    """Get the content of a generated file (path relative to the project).
+
+    Sync so FastAPI runs the disk read in its threadpool.
+    """
+    content = read_project_file(project_id, path)
+    if content is None:
+        raise HTTPException(status_code=404, detail="File not found")
+
+    return content
 
 
 @router.get("/tools/{project_id}/schema/{format}")
@@ -40,7 +62,7 @@ async def get_tool_schema(project_id: str, format: SchemaFormat):
     if not schema:
         raise HTTPException(status_code=404, detail="Project not found")
 
-    return {
+    return FastJSONResponse({
         "format": format.value,
         "schema": schema,
-    }
+    })
@@ -0,0 +1,122 @@
+"""Load testing for generated tool backends."""
+
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from datetime import datetime
+
+from src.generator import get_project, PROJECT_FILE
+
+
+WORKER_PATH = Path(__file__).parent / "worker.py"
+
+# Benchmark results are stored alongside the generated project
+RESULTS_FILE = "bench_results.json"
+
+
+def find_project_dir(project_id: str, output_dir: str = "generated") -> Path | None:
+    """Locate a project directory, in memory first, then on disk."""
+    project = get_project(project_id)
+    if project:
+        return Path(project.path)
+
+    matches = sorted(Path(output_dir).glob(f"*-{project_id}"))
+    return matches[0] if matches else None
+
+
+def load_bench_results(project_dir: Path) -> dict | None:
+    """Load the latest benchmark results stored with a project."""
+    results_path = project_dir / RESULTS_FILE
+    if not results_path.exists():
+        return None
+    return json.loads(results_path.read_text())
+
+
+def load_functions(project_id: str, project_dir: Path) -> list[dict]:
+    """Get the validated function definitions for a project.
+
+    Reads the metadata written at generation time when the project is not
+    held in memory (e.g. when running from a fresh CLI process).
+
+    Raises:
+        RuntimeError: If the metadata is missing, malformed or has no functions
+    """
+    project = get_project(project_id)
+    if project:
+        functions = project.tools
+    else:
+        metadata_path = project_dir / PROJECT_FILE
+        if not metadata_path.exists():
+            raise RuntimeError(f"No {PROJECT_FILE} in {project_dir}; regenerate the tool to benchmark it")
+        try:
+            functions = json.loads(metadata_path.read_text())["tools"]
+        except (ValueError, KeyError, TypeError) as e:
+            raise RuntimeError(f"Invalid {metadata_path}: {e}")
+
+    if not isinstance(functions, list) or not functions:
+        raise RuntimeError("Project has no functions to benchmark")
+    return functions
+
+
+def run_benchmark(
+    project_id: str,
+    requests: int = 100,
+    concurrency: int = 10,
+    output_dir: str = "generated",
+    timeout: float = 300,
+) -> dict | None:
+    """Load test a generated tool's API in an isolated subprocess.
+
+    Each function is matched to a route of the generated `src/api/main.py`
+    and called with synthetic arguments built from its parameter schema,
+    through an ASGI transport (no network needed).
+
+    Returns:
+        Benchmark results, or None if the project is not found
+
+    Raises:
+        RuntimeError: If the project cannot be benchmarked or the run fails
+    """
+    project_dir = find_project_dir(project_id, output_dir)
+    if not project_dir:
+        return None
+
+    config = {
+        "functions": load_functions(project_id, project_dir),
+        "requests": requests,
+        "concurrency": concurrency,
+    }
+
+    with tempfile.TemporaryDirectory() as tmp:
+        config_path = Path(tmp) / "config.json"
+        results_path = Path(tmp) / "results.json"
+        config_path.write_text(json.dumps(config))
+
+        try:
+            proc = subprocess.run(
+                [sys.executable, str(WORKER_PATH), str(config_path), str(results_path)],
+                cwd=project_dir,
+                capture_output=True,
+                text=True,
+                timeout=timeout,
+            )
+        except subprocess.TimeoutExpired:
+            raise RuntimeError(f"Benchmark timed out after {timeout}s")
+        if proc.returncode != 0:
+            raise RuntimeError(f"Benchmark failed:\n{proc.stderr.strip()[-2000:]}")
+
+        if not results_path.exists() or not results_path.stat().st_size:
+            raise RuntimeError("Benchmark produced no results")
+        results = json.loads(results_path.read_text())
+
+    # Keep earlier results rather than overwriting them with an empty run
+    if not any(stats.get("route") for stats in results["functions"].values()):
+        names = ", ".join(results["functions"])
+        raise RuntimeError(f"No function matched a route in src/api/main.py: {names}")
+
+    results["created_at"] = datetime.now().isoformat()
+    (project_dir / RESULTS_FILE).write_text(json.dumps(results, indent=2))
+
+    return results
@@ -0,0 +1,283 @@
+"""Benchmark worker, run in a subprocess from inside a generated project.
+
+This module must not import AgentKit: generated projects ship their own
+top-level `src` package, which would shadow ours.
+
+Usage: python worker.py <config.json> <results.json>
+"""
+
+import asyncio
+import importlib
+import json
+import math
+import os
+import re
+import sys
+import time
+
+try:
+    import re._parser as sre_parse
+except ImportError:  # Python < 3.11
+    import sre_parse
+
+
+# Sample values for common JSON schema string formats
+FORMAT_SAMPLES = {
+    "date": "2024-01-15",
+    "date-time": "2024-01-15T12:00:00Z",
+    "time": "12:00:00",
+    "email": "test@example.com",
+    "uri": "https://example.com",
+    "url": "https://example.com",
+    "hostname": "example.com",
+    "ipv4": "127.0.0.1",
+    "ipv6": "::1",
+    "uuid": "123e4567-e89b-42d3-a456-426614174000",
+}
+
+
+def _sample_pattern(parsed) -> str:
+    """Build a string matching a parsed regular expression."""
+    out = []
+    for op, arg in parsed:
+        name = str(op)
+        if name == "LITERAL":
+            out.append(chr(arg))
+        elif name == "NOT_LITERAL":
+            out.append("b" if chr(arg) == "a" else "a")
+        elif name == "ANY":
+            out.append("a")
+        elif name == "IN":
+            out.append(_sample_pattern(arg[:1]) if str(arg[0][0]) != "NEGATE" else "~")
+        elif name == "RANGE":
+            out.append(chr(arg[0]))
+        elif name == "CATEGORY":
+            out.append({"CATEGORY_DIGIT": "1", "CATEGORY_SPACE": " "}.get(str(arg), "a"))
+        elif name in ("MAX_REPEAT", "MIN_REPEAT", "POSSESSIVE_REPEAT"):
+            low, _, item = arg
+            out.append(_sample_pattern(item) * low)
+        elif name == "SUBPATTERN":
+            out.append(_sample_pattern(arg[-1]))
+        elif name == "BRANCH":
+            out.append(_sample_pattern(arg[1][0]))
+        elif name == "AT":
+            continue
+        else:
+            raise ValueError(f"Unsupported pattern element: {name}")
+    return "".join(out)
+
+
+def _sample_string(schema: dict, name: str) -> str:
+    """Build a string honouring format, pattern and length constraints."""
+    if schema.get("format") in FORMAT_SAMPLES:
+        return FORMAT_SAMPLES[schema["format"]]
+
+    if "pattern" in schema:
+        try:
+            value = _sample_pattern(sre_parse.parse(schema["pattern"]))
+            if re.search(schema["pattern"], value):
+                return value
+        except (ValueError, re.error):
+            pass
+
+    value = f"test-{name}"
+    min_length = schema.get("minLength", 0)
+    max_length = schema.get("maxLength")
+    value = value.ljust(min_length, "x")
+    if max_length is not None:
+        value = value[:max_length]
+    return value
+
+
+def _sample_number(schema: dict, integer: bool) -> int | float:
+    """Build a number within the schema's bounds."""
+    lower, upper = schema.get("minimum"), schema.get("maximum")
+    exclusive_lower, exclusive_upper = schema.get("exclusiveMinimum"), schema.get("exclusiveMaximum")
+    # Draft 4 uses booleans that make minimum/maximum exclusive
+    if isinstance(exclusive_lower, bool):
+        exclusive_lower = lower if exclusive_lower else None
+    if isinstance(exclusive_upper, bool):
+        exclusive_upper = upper if exclusive_upper else None
+
+    step = 1 if integer else 0.5
+    if exclusive_lower is not None:
+        lower = max(lower, exclusive_lower + step) if lower is not None else exclusive_lower + step
+    if exclusive_upper is not None:
+        upper = min(upper, exclusive_upper - step) if upper is not None else exclusive_upper - step
+
+    value = 1
+    if lower is not None:
+        value = max(value, lower)
+    if upper is not None:
+        value = min(value, upper)
+    if lower is not None and value < lower:
+        # Bounds too tight for the step: take the middle of the range
+        value = (lower + upper) / 2
+    return int(math.ceil(value)) if integer else float(value)
+
+
+def sample_value(schema: dict, name: str = "value"):
+    """Build a synthetic value that satisfies a JSON schema."""
+    if schema.get("enum"):
+        return schema["enum"][0]
+    if "default" in schema:
+        return schema["default"]
+    if "example" in schema:
+        return schema["example"]
+
+    kind = schema.get("type", "string")
+    if isinstance(kind, list):
+        kind = next((k for k in kind if k != "null"), "string")
+
+    if kind == "object":
+        return {
+            key: sample_value(value, key)
+            for key, value in schema.get("properties", {}).items()
+        }
+    if kind == "array":
+        return [sample_value(schema.get("items", {}), name)] * max(schema.get("minItems", 1), 1)
+    if kind in ("integer", "number"):
+        return _sample_number(schema, integer=kind == "integer")
+    if kind == "boolean":
+        return True
+    return _sample_string(schema, name)
+
+
+def _normalize(name: str) -> str:
+    """Normalize a function name or path segment for matching."""
+    return name.lower().replace("_", "-")
+
+
+def find_route(routes: list, function_name: str):
+    """Find the route serving a function, by endpoint name then by path segment."""
+    for route in routes:
+        if getattr(route, "name", None) == function_name:
+            return route
+
+    target = _normalize(function_name)
+    for route in routes:
+        segments = [_normalize(s) for s in route.path.strip("/").split("/")]
+        if target in segments:
+            return route
+
+    return None
+
+
+def percentile(values: list[float], p: float) -> float:
+    """Nearest-rank percentile of a list of values."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, math.ceil(p / 100 * len(ordered)) - 1)
+    return ordered[index]
+
+
+def build_request(route, args: dict) -> tuple[str, str, dict]:
+    """Build (method, url, httpx kwargs) for calling a route with args."""
+    args = dict(args)
+    method = "GET" if "GET" in route.methods else sorted(route.methods)[0]
+
+    # Fill path parameters from the sampled arguments
+    url = re.sub(
+        r"\{(\w+)(:\w+)?\}",
+        lambda m: str(args.pop(m.group(1), "test")),
+        route.path,
+    )
+
+    if method in ("GET", "DELETE"):
+        return method, url, {"params": args}
+    return method, url, {"json": args}
+
+
+async def bench_route(client, method: str, url: str, kwargs: dict, requests: int, concurrency: int) -> dict:
+    """Send `requests` calls to one route, at most `concurrency` at a time."""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+    # 4xx usually means the synthetic arguments were rejected, 5xx (or an
+    # exception) that the tool itself failed
+    client_errors = 0
+    server_errors = 0
+
+    async def call():
+        nonlocal client_errors, server_errors
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                response = await client.request(method, url, **kwargs)
+                if 400 <= response.status_code < 500:
+                    client_errors += 1
+                elif response.status_code >= 500:
+                    server_errors += 1
+            except Exception:
+                server_errors += 1
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(call() for _ in range(requests)))
+    elapsed = time.perf_counter() - start
+
+    errors = client_errors + server_errors
+    return {
+        "requests": requests,
+        "errors": errors,
+        "error_rate": errors / requests if requests else 0.0,
+        "client_errors": client_errors,
+        "client_error_rate": client_errors / requests if requests else 0.0,
+        "server_errors": server_errors,
+        "server_error_rate": server_errors / requests if requests else 0.0,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "throughput_rps": requests / elapsed if elapsed else 0.0,
+    }
+
+
+async def run(config: dict) -> dict:
+    """Benchmark every function of the generated app."""
+    import httpx
+
+    module = importlib.import_module(config.get("app_module", "src.api.main"))
+    app = module.app
+    routes = [r for r in app.routes if getattr(r, "methods", None)]
+
+    results = {}
+    transport = httpx.ASGITransport(app=app)
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            for function in config["functions"]:
+                name = function["name"]
+                route = find_route(routes, name)
+                if route is None:
+                    results[name] = {"route": None, "error": "No matching route"}
+                    continue
+
+                args = sample_value(function.get("parameters", {"type": "object"}), name)
+                method, url, kwargs = build_request(route, args if isinstance(args, dict) else {})
+                stats = await bench_route(
+                    client, method, url, kwargs,
+                    requests=config["requests"],
+                    concurrency=config["concurrency"],
+                )
+                results[name] = {"route": f"{method} {route.path}", **stats}
+
+    return {
+        "requests": config["requests"],
+        "concurrency": config["concurrency"],
+        "functions": results,
+    }
+
+
+def main():
+    config_path, results_path = sys.argv[1], sys.argv[2]
+    with open(config_path) as f:
+        config = json.load(f)
+
+    # Import the generated project from the working directory, not from here
+    sys.path[0] = os.getcwd()
+
+    results = asyncio.run(run(config))
+    with open(results_path, "w") as f:
+        json.dump(results, f)
+
+
+if __name__ == "__main__":
+    main()
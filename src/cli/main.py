@@ -10,6 +10,7 @@ from rich.syntax import Syntax
 import json
 
 from src.generator import generate_tool, list_projects, get_project, get_schema
+from src.bench import run_benchmark, RESULTS_FILE
 
 app = typer.Typer(
     name="agentkit",
@@ -97,10 +98,10 @@ def list():
 
     for p in projects:
         table.add_row(
-            p["project_id"],
-            p["name"],
-            p["description"][:50] + "..." if len(p["description"]) > 50 else p["description"],
-            p["created_at"][:19],
+            p.project_id,
+            p.name,
+            p.description[:50] + "..." if len(p.description) > 50 else p.description,
+            p.created_at[:19],
         )
 
     console.print(table)
@@ -131,23 +132,21 @@ def info(project_id: str = typer.Argument(..., help="Project ID")):
         console.print(f"[red]Project not found: {project_id}[/red]")
         raise typer.Exit(1)
 
-    tool = project["tool"]
-
-    console.print(Panel(f"[bold]{tool.name}[/bold]"))
+    console.print(Panel(f"[bold]{project.name}[/bold]"))
 
     table = Table()
     table.add_column("Property", style="cyan")
     table.add_column("Value", style="white")
     table.add_row("Project ID", project_id)
-    table.add_row("Name", tool.name)
-    table.add_row("Description", tool.description)
-    table.add_row("Path", project["path"])
-    table.add_row("Created", project["created_at"])
+    table.add_row("Name", project.name)
+    table.add_row("Description", project.description)
+    table.add_row("Path", project.path)
+    table.add_row("Created", project.created_at)
     console.print(table)
 
     console.print()
     console.print("[bold]Functions:[/bold]")
-    for func in tool.tools:
+    for func in project.tools:
         console.print(f"  [cyan]{func['name']}[/cyan]")
         console.print(f"    {func['description']}")
         if func.get("parameters", {}).get("properties"):
@@ -157,5 +156,60 @@ def info(project_id: str = typer.Argument(..., help="Project ID")):
                 console.print(f"    - {param}{req_str}: {details.get('type', 'any')}")
 
 
+@app.command()
+def bench(
+    project_id: str = typer.Argument(..., help="Project ID"),
+    requests: int = typer.Option(100, "--requests", "-n", help="Requests per function"),
+    concurrency: int = typer.Option(10, "--concurrency", "-c", help="Concurrent requests"),
+    output: str = typer.Option("generated", "--output", "-o", help="Output directory"),
+):
+    """Load test a generated tool's API before deploying it."""
+    with console.status(f"Benchmarking {project_id}..."):
+        try:
+            result = run_benchmark(
+                project_id,
+                requests=requests,
+                concurrency=concurrency,
+                output_dir=output,
+            )
+        except RuntimeError as e:
+            console.print(f"[red]{e}[/red]")
+            raise typer.Exit(1)
+
+    if result is None:
+        console.print(f"[red]Project not found: {project_id}[/red]")
+        raise typer.Exit(1)
+
+    table = Table(title=f"Benchmark ({requests} requests, concurrency {concurrency})")
+    table.add_column("Function", style="cyan")
+    table.add_column("Route", style="dim")
+    table.add_column("p50 (ms)", justify="right")
+    table.add_column("p99 (ms)", justify="right")
+    table.add_column("Req/s", justify="right")
+    table.add_column("4xx", justify="right")
+    table.add_column("5xx", justify="right")
+
+    for name, stats in result["functions"].items():
+        if stats.get("route") is None:
+            table.add_row(name, "[yellow]no matching route[/yellow]", "-", "-", "-", "-", "-")
+            continue
+        client_errors = f"{stats['client_error_rate']:.1%}"
+        server_errors = f"{stats['server_error_rate']:.1%}"
+        table.add_row(
+            name,
+            stats["route"],
+            f"{stats['p50_ms']:.1f}",
+            f"{stats['p99_ms']:.1f}",
+            f"{stats['throughput_rps']:.0f}",
+            f"[yellow]{client_errors}[/yellow]" if stats["client_errors"] else client_errors,
+            f"[red]{server_errors}[/red]" if stats["server_errors"] else server_errors,
+        )
+
+    console.print(table)
+    if any(stats.get("client_errors") for stats in result["functions"].values()):
+        console.print("[dim]4xx errors usually mean the synthetic arguments were rejected, not that the tool is broken[/dim]")
+    console.print(f"[dim]Results saved to {RESULTS_FILE} in the project directory[/dim]")
+
+
 if __name__ == "__main__":
     app()
@@ -2,12 +2,28 @@
 
 import os
 import json
+import asyncio
 from google import genai
 from google.genai import types
 from dotenv import load_dotenv
 
+from src.core.schemas import GenerationPolicy, PolicyStats
+
 load_dotenv()
 
+# Approximate USD prices per 1M (input, output) tokens, for policy cost stats
+MODEL_PRICES = {
+    "gemini-2.0-flash": (0.10, 0.40),
+    "gemini-2.5-flash": (0.30, 2.50),
+    "gemini-2.5-pro": (1.25, 10.00),
+}
+
+# Rough prompt size estimate for requests cancelled before reporting usage
+CHARS_PER_TOKEN = 4
+
+# Statistics per generation policy name
+_policy_stats: dict[str, PolicyStats] = {}
+
 
 def get_client() -> genai.Client:
     """Get Gemini client."""
@@ -17,8 +33,151 @@ def get_client() -> genai.Client:
     return genai.Client(api_key=api_key)
 
 
-def generate_tool_code(description: str, name: str, requirements: list[str]) -> dict:
-    """Generate complete tool code using Gemini 3 Pro."""
+def get_policy() -> GenerationPolicy:
+    """Get the generation policy configured in the environment."""
+    config = {}
+    models = os.getenv("AGENTKIT_GENERATION_MODELS")
+    if models:
+        config["models"] = [m.strip() for m in models.split(",") if m.strip()]
+    hedge_after = os.getenv("AGENTKIT_HEDGE_AFTER")
+    if hedge_after:
+        config["hedge_after"] = float(hedge_after)
+    return GenerationPolicy(**config)
+
+
+def get_policy_stats() -> dict[str, PolicyStats]:
+    """Get statistics for every policy used so far."""
+    return _policy_stats
+
+
+def _parse_json(text: str | None) -> dict:
+    """Parse a JSON response, removing markdown code blocks if present."""
+    text = (text or "").strip()
+    if text.startswith("```"):
+        lines = text.split("\n")
+        text = "\n".join(lines[1:-1]) if lines[-1] == "```" else "\n".join(lines[1:])
+
+    return json.loads(text)
+
+
+def validate_tool_code(result: dict) -> None:
+    """Check generated tool code has the expected structure.
+
+    Raises:
+        ValueError: If the output is not usable
+    """
+    if not isinstance(result, dict):
+        raise ValueError("Generated output is not a JSON object")
+    files = result.get("files")
+    if not isinstance(files, list) or not files:
+        raise ValueError("Generated output has no files")
+    for f in files:
+        if not isinstance(f, dict) or not isinstance(f.get("path"), str) or not isinstance(f.get("content"), str):
+            raise ValueError("Generated file is missing a path or content")
+    functions = result.get("functions", [])
+    if not isinstance(functions, list) or not all(isinstance(f, dict) and "name" in f for f in functions):
+        raise ValueError("Generated functions are malformed")
+
+
+def _record_usage(stats: PolicyStats, model: str, usage) -> None:
+    """Add a response's token usage and estimated cost to the stats."""
+    if usage is None:
+        return
+    input_tokens = usage.prompt_token_count or 0
+    output_tokens = usage.candidates_token_count or 0
+    stats.input_tokens += input_tokens
+    stats.output_tokens += output_tokens
+    input_price, output_price = MODEL_PRICES.get(model, (0.0, 0.0))
+    stats.cost_usd += (input_tokens * input_price + output_tokens * output_price) / 1_000_000
+
+
+def _record_cancelled(stats: PolicyStats, model: str, prompt: str) -> None:
+    """Add the estimated prompt cost of a cancelled request to the stats."""
+    input_price, _ = MODEL_PRICES.get(model, (0.0, 0.0))
+    stats.cancelled_requests += 1
+    stats.estimated_cancelled_cost_usd += len(prompt) / CHARS_PER_TOKEN * input_price / 1_000_000
+
+
+async def _request_tool_code(client: genai.Client, model: str, prompt: str, stats: PolicyStats) -> dict:
+    """Make a single generation request and validate its output."""
+    try:
+        response = await client.aio.models.generate_content(
+            model=model,
+            contents=prompt,
+            config=types.GenerateContentConfig(
+                temperature=0.7,
+                max_output_tokens=8192,
+            ),
+        )
+    except asyncio.CancelledError:
+        # The prompt was already sent, so it is billed even without a response
+        _record_cancelled(stats, model, prompt)
+        raise
+    _record_usage(stats, model, response.usage_metadata)
+
+    result = _parse_json(response.text)
+    validate_tool_code(result)
+    return result
+
+
+async def _hedged_request(
+    client: genai.Client,
+    model: str,
+    prompt: str,
+    policy: GenerationPolicy,
+    stats: PolicyStats,
+) -> dict:
+    """Request tool code, firing a duplicate request if the first one is slow.
+
+    The first valid result wins and the other request is cancelled.
+    """
+    primary = asyncio.create_task(_request_tool_code(client, model, prompt, stats))
+    hedge = None
+    pending = {primary}
+    error = None
+
+    try:
+        if policy.hedge_after is not None:
+            done, pending = await asyncio.wait(pending, timeout=policy.hedge_after)
+            if not done:
+                hedge = asyncio.create_task(_request_tool_code(client, model, prompt, stats))
+                pending.add(hedge)
+                stats.hedges += 1
+            else:
+                # Primary already finished; handle its result below
+                pending = done
+
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            # Retrieve every exception, even when another task wins
+            errors = {task: task.exception() for task in done}
+            for task, task_error in errors.items():
+                if task_error is None:
+                    if task is hedge:
+                        stats.hedge_wins += 1
+                    return task.result()
+                error = task_error
+    finally:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    raise error
+
+
+async def generate_tool_code(
+    description: str,
+    name: str,
+    requirements: list[str],
+    policy: GenerationPolicy | None = None,
+) -> dict:
+    """Generate complete tool code using Gemini 3 Pro.
+
+    Models in the policy's cascade are tried in order; a stronger model is
+    only used when the previous one returns output that fails validation.
+    """
+    policy = policy or get_policy()
+    stats = _policy_stats.setdefault(policy.name, PolicyStats())
     client = get_client()
 
     requirements_str = "\n".join(f"- {r}" for r in requirements) if requirements else "None specified"
@@ -103,24 +262,26 @@ Requirements for generated code:
 
 Return ONLY valid JSON, no markdown code blocks."""
 
-    response = client.models.generate_content(
-        model="gemini-2.0-flash",
-        contents=prompt,
-        config=types.GenerateContentConfig(
-            temperature=0.7,
-            max_output_tokens=8192,
-        ),
-    )
-
-    # Parse response
-    text = response.text.strip()
+    stats.requests += 1
+    error = None
+    for i, model in enumerate(policy.models):
+        if i > 0:
+            stats.escalations += 1
+        try:
+            result = await _hedged_request(client, model, prompt, policy, stats)
+        except ValueError as e:
+            # Invalid output: escalate to the next model
+            error = e
+            continue
+        except Exception:
+            stats.failures += 1
+            raise
 
-    # Remove markdown code blocks if present
-    if text.startswith("```"):
-        lines = text.split("\n")
-        text = "\n".join(lines[1:-1]) if lines[-1] == "```" else "\n".join(lines[1:])
+        stats.model_wins[model] = stats.model_wins.get(model, 0) + 1
+        return result
 
-    return json.loads(text)
+    stats.failures += 1
+    raise error
 
 
 def analyze_code(code: str) -> dict:
@@ -153,9 +314,4 @@ Return ONLY valid JSON."""
         ),
     )
 
-    text = response.text.strip()
-    if text.startswith("```"):
-        lines = text.split("\n")
-        text = "\n".join(lines[1:-1]) if lines[-1] == "```" else "\n".join(lines[1:])
-
-    return json.loads(text)
+    return _parse_json(response.text)
@@ -1,6 +1,6 @@
 """Pydantic models for AgentKit."""
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 from typing import Literal
 from enum import Enum
 
@@ -26,6 +26,85 @@ class GeneratedTool(BaseModel):
     files: list[GeneratedFile]
 
 
+class ProjectRecord(BaseModel):
+    """Metadata kept in memory for a generated project.
+
+    File contents are not held here; they are read from disk on demand.
+    """
+    name: str
+    description: str
+    tools: list[dict]
+    files: list[str]  # File paths relative to `path`
+    created_at: str
+    path: str
+
+
+class ProjectSummary(BaseModel):
+    """Project entry returned by the tools listing."""
+    project_id: str
+    name: str
+    description: str
+    created_at: str
+    path: str
+
+
+class ToolList(BaseModel):
+    """Response for listing all generated tools."""
+    tools: list[ProjectSummary]
+
+
+class ToolDetail(ProjectSummary):
+    """Response with the details of a generated tool."""
+    tools: list[dict]
+    files: list[str]
+    relative_files: list[str]  # Paths accepted by /tools/{project_id}/files/{path}
+    bench: dict | None = None
+
+
+class GenerationPolicy(BaseModel):
+    """How tool code is requested from Gemini."""
+    name: str = Field("", description="Stats key; derived from the configuration if empty")
+    models: list[str] = Field(
+        default_factory=lambda: ["gemini-2.0-flash"],
+        min_length=1,
+        description="Model cascade: each model is tried only if the previous one returned invalid output",
+    )
+    hedge_after: float | None = Field(
+        None,
+        description="Seconds to wait before firing a duplicate request (disabled if None)",
+    )
+
+    @model_validator(mode="after")
+    def derive_name(self) -> "GenerationPolicy":
+        """Name the policy after its configuration, e.g. `flash>pro@hedge20`."""
+        if not self.name:
+            self.name = ">".join(self.models)
+            if self.hedge_after is not None:
+                self.name += f"@hedge{self.hedge_after:g}"
+        return self
+
+
+class PolicyStats(BaseModel):
+    """Running statistics for a generation policy."""
+    requests: int = 0
+    failures: int = 0
+    escalations: int = 0
+    hedges: int = 0
+    hedge_wins: int = 0
+    model_wins: dict[str, int] = Field(default_factory=dict)
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cost_usd: float = 0.0
+    # Cancelled hedge losers: their prompts are billed but never report usage
+    cancelled_requests: int = 0
+    estimated_cancelled_cost_usd: float = 0.0
+
+
+class GenerationStats(BaseModel):
+    """Statistics for every generation policy used so far."""
+    policies: dict[str, PolicyStats]
+
+
 class SchemaFormat(str, Enum):
     """Supported agent schema formats."""
     OPENAI = "openai"
@@ -3,15 +3,26 @@
 import os
 import re
 import uuid
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
 
 from src.core.gemini import generate_tool_code
-from src.core.schemas import GeneratedTool, GeneratedFile
+from src.core.schemas import GeneratedTool, GeneratedFile, GenerationPolicy, ProjectRecord, ProjectSummary
 
 
-# In-memory storage for generated projects
-_projects: dict[str, dict] = {}
+# In-memory storage for generated projects (metadata only)
+_projects: dict[str, ProjectRecord] = {}
+
+# Project metadata written next to the generated files, so other processes
+# (e.g. `agentkit bench`) can read the validated function definitions
+PROJECT_FILE = "agentkit.json"
+
+# Number of file contents kept in memory after being read from disk.
+# Files larger than FILE_CACHE_MAX_BYTES are always read from disk, so the
+# cache holds at most FILE_CACHE_SIZE * FILE_CACHE_MAX_BYTES (2 MiB).
+FILE_CACHE_SIZE = 32
+FILE_CACHE_MAX_BYTES = 64 * 1024
 
 
 def slugify(text: str) -> str:
@@ -27,6 +38,7 @@ async def generate_tool(
     name: str | None = None,
     requirements: list[str] | None = None,
     output_dir: str = "generated",
+    policy: GenerationPolicy | None = None,
 ) -> tuple[str, GeneratedTool]:
     """Generate a complete agent tool.
 
@@ -39,10 +51,11 @@ async def generate_tool(
         name = slugify("-".join(words))
 
     # Generate code with Gemini
-    result = generate_tool_code(
+    result = await generate_tool_code(
         description=description,
         name=name,
         requirements=requirements or [],
+        policy=policy,
     )
 
     # Create project directory
@@ -66,32 +79,69 @@ async def generate_tool(
         files=files,
     )
 
-    # Store in memory
-    _projects[project_id] = {
-        "tool": tool,
-        "created_at": datetime.now().isoformat(),
-        "path": str(project_dir),
-    }
+    # Store metadata only; file contents stay on disk
+    project = ProjectRecord(
+        name=tool.name,
+        description=tool.description,
+        tools=tool.tools,
+        files=[f["path"] for f in result.get("files", [])],
+        created_at=datetime.now().isoformat(),
+        path=str(project_dir),
+    )
+    (project_dir / PROJECT_FILE).write_text(project.model_dump_json(indent=2, exclude={"path"}))
+    _projects[project_id] = project
 
     return project_id, tool
 
 
-def get_project(project_id: str) -> dict | None:
+def get_project(project_id: str) -> ProjectRecord | None:
     """Get a stored project by ID."""
     return _projects.get(project_id)
 
 
-def list_projects() -> list[dict]:
+@lru_cache(maxsize=FILE_CACHE_SIZE)
+def _read_cached_file(path: str) -> str:
+    """Read a small generated file from disk, caching recent reads."""
+    return Path(path).read_text()
+
+
+def _read_file(path: str) -> str:
+    """Read a generated file, caching it only if it is small."""
+    if Path(path).stat().st_size > FILE_CACHE_MAX_BYTES:
+        return Path(path).read_text()
+    return _read_cached_file(path)
+
+
+def read_project_file(project_id: str, path: str) -> str | None:
+    """Read the content of a project file.
+
+    Only paths recorded for the project are served, so callers cannot
+    read arbitrary files from disk.
+
+    Returns:
+        File content, or None if the project or file is unknown
+    """
+    project = get_project(project_id)
+    if not project or path not in project.files:
+        return None
+
+    try:
+        return _read_file(str(Path(project.path) / path))
+    except FileNotFoundError:
+        return None
+
+
+def list_projects() -> list[ProjectSummary]:
     """List all generated projects."""
     return [
-        {
-            "project_id": pid,
-            "name": data["tool"].name,
-            "description": data["tool"].description,
-            "created_at": data["created_at"],
-            "path": data["path"],
-        }
-        for pid, data in _projects.items()
+        ProjectSummary(
+            project_id=pid,
+            name=project.name,
+            description=project.description,
+            created_at=project.created_at,
+            path=project.path,
+        )
+        for pid, project in _projects.items()
     ]
 
 
@@ -101,8 +151,7 @@ def get_schema(project_id: str, format: str) -> dict | None:
     if not project:
         return None
 
-    tool = project["tool"]
-    functions = tool.tools
+    functions = project.tools
 
     if format == "openai":
         return {
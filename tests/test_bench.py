@@ -0,0 +1,208 @@
+"""Tests for the bench module."""
+
+import json
+import subprocess
+from types import SimpleNamespace
+
+import pytest
+
+import src.bench as bench
+import src.generator as generator
+from src.generator import PROJECT_FILE
+from src.bench import run_benchmark, load_bench_results
+from src.bench.worker import sample_value, find_route, percentile, build_request
+
+APP_SOURCE = """
+from contextlib import asynccontextmanager
+from datetime import date
+
+from fastapi import FastAPI, HTTPException
+from pydantic import BaseModel, Field
+
+state = {}
+
+
+@asynccontextmanager
+async def lifespan(app):
+    state["ready"] = True
+    yield
+
+
+app = FastAPI(lifespan=lifespan)
+
+
+class Booking(BaseModel):
+    day: date
+    email: str = Field(pattern=r"^[^@]+@[^@]+$")
+    guests: int = Field(gt=0, le=8)
+
+
+@app.post("/bookings")
+async def create_booking(booking: Booking):
+    if not state.get("ready"):
+        raise HTTPException(status_code=500, detail="Lifespan did not run")
+    return booking
+
+
+@app.get("/fail")
+async def always_fail():
+    raise HTTPException(status_code=500, detail="Broken")
+"""
+
+
+def test_sample_value():
+    """Test synthetic values follow the parameter schema."""
+    schema = {
+        "type": "object",
+        "properties": {
+            "city": {"type": "string"},
+            "days": {"type": "integer", "minimum": 3},
+            "units": {"type": "string", "enum": ["metric", "imperial"]},
+            "tags": {"type": "array", "items": {"type": "string"}},
+        },
+    }
+    assert sample_value(schema) == {
+        "city": "test-city",
+        "days": 3,
+        "units": "metric",
+        "tags": ["test-tags"],
+    }
+
+
+def test_sample_value_constraints():
+    """Test synthetic values respect formats, patterns and bounds."""
+    assert sample_value({"type": "string", "format": "date"}) == "2024-01-15"
+    assert sample_value({"type": "string", "format": "email"}) == "test@example.com"
+    assert sample_value({"type": "string", "pattern": r"^[A-Z]{3}-\d{2}$"}) == "AAA-11"
+    assert len(sample_value({"type": "string", "minLength": 20})) == 20
+    assert len(sample_value({"type": "string", "maxLength": 3})) == 3
+    assert sample_value({"type": "integer", "maximum": -3}) == -3
+    assert sample_value({"type": "integer", "exclusiveMinimum": 5}) == 6
+    assert 0 < sample_value({"type": "number", "exclusiveMinimum": 0, "exclusiveMaximum": 0.5}) < 0.5
+
+
+def test_find_route_and_build_request():
+    """Test functions are matched to routes and path params are filled."""
+    routes = [
+        SimpleNamespace(name="root", path="/", methods={"GET"}),
+        SimpleNamespace(name="forecast", path="/get-weather/{city}", methods={"GET"}),
+        SimpleNamespace(name="add_task", path="/tasks", methods={"POST"}),
+    ]
+    weather = find_route(routes, "get_weather")
+    assert weather.path == "/get-weather/{city}"
+    assert build_request(weather, {"city": "paris", "days": 3}) == (
+        "GET", "/get-weather/paris", {"params": {"days": 3}}
+    )
+
+    task = find_route(routes, "add_task")
+    assert build_request(task, {"title": "x"}) == ("POST", "/tasks", {"json": {"title": "x"}})
+    assert find_route(routes, "delete_everything") is None
+
+
+def test_find_route_matches_whole_segments():
+    """Test a function name only matches a full path segment."""
+    routes = [SimpleNamespace(name="playlists", path="/playlists", methods={"GET"})]
+    assert find_route(routes, "list") is None
+    assert find_route(routes, "Playlists").path == "/playlists"
+
+
+def test_percentile():
+    """Test nearest-rank percentiles."""
+    values = [float(v) for v in range(1, 101)]
+    assert percentile(values, 50) == 50.0
+    assert percentile(values, 99) == 99.0
+    assert percentile([], 99) == 0.0
+
+
+def write_metadata(project_dir, functions):
+    (project_dir / PROJECT_FILE).write_text(json.dumps({"name": "booking", "tools": functions}))
+
+
+def test_run_benchmark(tmp_path, monkeypatch):
+    """Test a generated app is benchmarked in a subprocess and results stored."""
+    monkeypatch.setattr(generator, "_projects", {})
+    project_dir = tmp_path / "booking-abc12345"
+    (project_dir / "src" / "api").mkdir(parents=True)
+    (project_dir / "src" / "__init__.py").write_text("")
+    (project_dir / "src" / "api" / "__init__.py").write_text("")
+    (project_dir / "src" / "api" / "main.py").write_text(APP_SOURCE)
+    write_metadata(project_dir, [
+        {
+            "name": "create_booking",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "day": {"type": "string", "format": "date"},
+                    "email": {"type": "string", "format": "email"},
+                    "guests": {"type": "integer", "exclusiveMinimum": 0, "maximum": 8},
+                },
+            },
+        },
+        {"name": "always_fail", "parameters": {}},
+        {"name": "missing", "parameters": {}},
+    ])
+
+    results = run_benchmark("abc12345", requests=20, concurrency=5, output_dir=str(tmp_path))
+
+    booking = results["functions"]["create_booking"]
+    assert booking["route"] == "POST /bookings"
+    assert (booking["requests"], booking["errors"]) == (20, 0)
+    assert results["functions"]["always_fail"]["server_errors"] == 20
+    assert results["functions"]["always_fail"]["client_errors"] == 0
+    assert results["functions"]["missing"]["route"] is None
+    assert load_bench_results(project_dir) == results
+
+
+def test_run_benchmark_timeout(tmp_path, monkeypatch):
+    """Test a hanging tool is reported as a RuntimeError."""
+    monkeypatch.setattr(generator, "_projects", {})
+    (tmp_path / "slow-abc12345").mkdir()
+    write_metadata(tmp_path / "slow-abc12345", [{"name": "slow", "parameters": {}}])
+
+    def hang(*args, timeout, **kwargs):
+        raise subprocess.TimeoutExpired(args[0], timeout)
+
+    monkeypatch.setattr(bench.subprocess, "run", hang)
+    with pytest.raises(RuntimeError, match="timed out after 5s"):
+        run_benchmark("abc12345", output_dir=str(tmp_path), timeout=5)
+
+
+def test_run_benchmark_missing_metadata(tmp_path, monkeypatch):
+    """Test a project without function metadata is reported, not run."""
+    monkeypatch.setattr(generator, "_projects", {})
+    (tmp_path / "tool-abc12345").mkdir()
+
+    with pytest.raises(RuntimeError, match=PROJECT_FILE):
+        run_benchmark("abc12345", output_dir=str(tmp_path))
+
+
+def test_run_benchmark_malformed_metadata(tmp_path, monkeypatch):
+    """Test malformed or empty function metadata is reported, not run."""
+    monkeypatch.setattr(generator, "_projects", {})
+    project_dir = tmp_path / "tool-abc12345"
+    project_dir.mkdir()
+
+    (project_dir / PROJECT_FILE).write_text("{not json")
+    with pytest.raises(RuntimeError, match="Invalid"):
+        run_benchmark("abc12345", output_dir=str(tmp_path))
+
+    write_metadata(project_dir, [])
+    with pytest.raises(RuntimeError, match="no functions"):
+        run_benchmark("abc12345", output_dir=str(tmp_path))
+    assert load_bench_results(project_dir) is None
+
+
+def test_run_benchmark_keeps_results_when_nothing_matched(tmp_path, monkeypatch):
+    """Test a run with no matching routes does not overwrite earlier results."""
+    monkeypatch.setattr(generator, "_projects", {})
+    project_dir = tmp_path / "booking-abc12345"
+    (project_dir / "src" / "api").mkdir(parents=True)
+    (project_dir / "src" / "__init__.py").write_text("")
+    (project_dir / "src" / "api" / "__init__.py").write_text("")
+    (project_dir / "src" / "api" / "main.py").write_text(APP_SOURCE)
+    write_metadata(project_dir, [{"name": "missing", "parameters": {}}])
+    (project_dir / bench.RESULTS_FILE).write_text('{"functions": {}}')
+
+    with pytest.raises(RuntimeError, match="No function matched"):
+        run_benchmark("abc12345", requests=1, output_dir=str(tmp_path))
+    assert load_bench_results(project_dir) == {"functions": {}}
@@ -0,0 +1,99 @@
+"""Tests for the Gemini generation policy."""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+import src.core.gemini as gemini
+from src.core.schemas import GenerationPolicy
+
+VALID = json.dumps({
+    "tool_name": "weather",
+    "functions": [{"name": "get_weather"}],
+    "files": [{"path": "README.md", "content": "# weather"}],
+})
+
+
+class FakeModels:
+    """Fake async models API returning (delay, text) per model, one per call."""
+
+    def __init__(self, replies: dict[str, list[tuple[float, str]]]):
+        self.replies = replies
+        self.calls = []
+        self.cancelled = 0
+
+    async def generate_content(self, model, contents, config):
+        self.calls.append(model)
+        delay, text = self.replies[model].pop(0)
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        usage = SimpleNamespace(prompt_token_count=1000, candidates_token_count=2000)
+        return SimpleNamespace(text=text, usage_metadata=usage)
+
+
+def use_fake_client(monkeypatch, replies):
+    models = FakeModels(replies)
+    client = SimpleNamespace(aio=SimpleNamespace(models=models))
+    monkeypatch.setattr(gemini, "get_client", lambda: client)
+    monkeypatch.setattr(gemini, "_policy_stats", {})
+    return models
+
+
+def test_hedged_request_wins_and_cancels_slow_request(monkeypatch):
+    """Test a hedged duplicate wins over a slow first request."""
+    models = use_fake_client(monkeypatch, {
+        "gemini-2.0-flash": [(1.0, VALID), (0.0, VALID)],
+    })
+    policy = GenerationPolicy(name="hedged", models=["gemini-2.0-flash"], hedge_after=0.05)
+
+    result = asyncio.run(gemini.generate_tool_code("weather", "weather", [], policy=policy))
+
+    assert result["tool_name"] == "weather"
+    assert models.cancelled == 1
+    stats = gemini.get_policy_stats()["hedged"]
+    assert (stats.requests, stats.hedges, stats.hedge_wins) == (1, 1, 1)
+    assert stats.model_wins == {"gemini-2.0-flash": 1}
+    assert stats.cancelled_requests == 1
+    assert stats.estimated_cancelled_cost_usd > 0
+
+
+def test_cascade_escalates_on_invalid_output(monkeypatch):
+    """Test the next model is used only when output fails validation."""
+    models = use_fake_client(monkeypatch, {
+        "gemini-2.0-flash": [(0.0, "not json")],
+        "gemini-2.5-pro": [(0.0, VALID)],
+    })
+    policy = GenerationPolicy(name="cascade", models=["gemini-2.0-flash", "gemini-2.5-pro"])
+
+    result = asyncio.run(gemini.generate_tool_code("weather", "weather", [], policy=policy))
+
+    assert result["files"][0]["path"] == "README.md"
+    assert models.calls == ["gemini-2.0-flash", "gemini-2.5-pro"]
+    stats = gemini.get_policy_stats()["cascade"]
+    assert stats.escalations == 1
+    assert stats.model_wins == {"gemini-2.5-pro": 1}
+    assert stats.cost_usd == pytest.approx((100 + 800 + 1250 + 20000) / 1_000_000)
+
+
+def test_cascade_raises_when_all_models_fail(monkeypatch):
+    """Test invalid output from every model is reported."""
+    use_fake_client(monkeypatch, {"fast": [(0.0, '{"files": []}')]})
+    policy = GenerationPolicy(name="failing", models=["fast"])
+
+    with pytest.raises(ValueError):
+        asyncio.run(gemini.generate_tool_code("weather", "weather", [], policy=policy))
+    assert gemini.get_policy_stats()["failing"].failures == 1
+
+
+def test_policy_name_follows_configuration(monkeypatch):
+    """Test env policies with different settings get different stats keys."""
+    monkeypatch.setenv("AGENTKIT_GENERATION_MODELS", "gemini-2.0-flash,gemini-2.5-pro")
+    monkeypatch.setenv("AGENTKIT_HEDGE_AFTER", "20")
+    assert gemini.get_policy().name == "gemini-2.0-flash>gemini-2.5-pro@hedge20"
+
+    monkeypatch.delenv("AGENTKIT_HEDGE_AFTER")
+    assert gemini.get_policy().name == "gemini-2.0-flash>gemini-2.5-pro"
@@ -1,7 +1,12 @@
 """Tests for the generator module."""
 
+import asyncio
+import json
+from pathlib import Path
+
 import pytest
-from src.generator import slugify
+import src.generator as generator
+from src.generator import slugify, generate_tool, get_project, read_project_file
 
 
 def test_slugify():
@@ -16,3 +21,45 @@ def test_slugify_max_length():
     long_text = "this is a very long description that should be truncated"
     result = slugify(long_text)
     assert len(result) <= 50
+
+
+def test_project_record_loads_files_lazily(tmp_path, monkeypatch):
+    """Test stored projects keep metadata only and read files from disk."""
+    monkeypatch.setattr(generator, "_projects", {})
+    generator._read_cached_file.cache_clear()
+
+    async def fake_generate_tool_code(**kwargs):
+        return {
+            "tool_name": "weather",
+            "tool_description": "Weather lookup",
+            "functions": [{"name": "get_weather", "description": "...", "parameters": {}}],
+            "files": [{"path": "src/api/main.py", "content": "app = None\n"}],
+        }
+
+    monkeypatch.setattr(generator, "generate_tool_code", fake_generate_tool_code)
+
+    project_id, tool = asyncio.run(generate_tool("weather tool", output_dir=str(tmp_path)))
+    project = get_project(project_id)
+
+    assert project.files == ["src/api/main.py"]
+    metadata = json.loads((Path(project.path) / generator.PROJECT_FILE).read_text())
+    assert metadata["tools"] == project.tools
+    assert "content" not in project.model_dump()
+    assert read_project_file(project_id, "src/api/main.py") == "app = None\n"
+    assert read_project_file(project_id, "../secrets.txt") is None
+    assert read_project_file("missing", "src/api/main.py") is None
+    generator._read_cached_file.cache_clear()
+
+
+def test_large_files_are_not_cached(tmp_path, monkeypatch):
+    """Test files above the size cap are read from disk every time."""
+    monkeypatch.setattr(generator, "FILE_CACHE_MAX_BYTES", 10)
+    generator._read_cached_file.cache_clear()
+    small, large = tmp_path / "small.txt", tmp_path / "large.txt"
+    small.write_text("tiny")
+    large.write_text("x" * 100)
+
+    assert generator._read_file(str(small)) == "tiny"
+    assert generator._read_file(str(large)) == "x" * 100
+    assert generator._read_cached_file.cache_info().currsize == 1
+    generator._read_cached_file.cache_clear()
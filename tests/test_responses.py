@@ -0,0 +1,95 @@
+"""Tests for API response serialization and compression."""
+
+import asyncio
+import json
+
+from fastapi.testclient import TestClient
+
+import src.generator as generator
+from src.api.main import app
+from src.api.responses import CompressionMiddleware, dumps, _parse_accept_encoding, _negotiate_encoding
+from src.core.schemas import PolicyStats, ProjectRecord
+
+
+def make_project(functions: int) -> ProjectRecord:
+    return ProjectRecord(
+        name="weather",
+        description="Weather lookup",
+        tools=[
+            {"name": f"func_{i}", "description": "x" * 100, "parameters": {"type": "object"}}
+            for i in range(functions)
+        ],
+        files=["src/api/main.py"],
+        created_at="2026-01-01T00:00:00",
+        path="generated/weather-abc12345",
+    )
+
+
+def test_dumps():
+    """Test models are serialized directly, alone or nested."""
+    stats = PolicyStats(requests=2)
+    assert json.loads(dumps(stats))["requests"] == 2
+    assert json.loads(dumps({"policies": {"default": stats}}))["policies"]["default"]["requests"] == 2
+
+
+def test_accept_encoding_negotiation():
+    """Test Accept-Encoding parsing honours q values, extra params and `*`."""
+    assert _parse_accept_encoding("gzip;foo=1;q=0.5, br;q=0") == {"gzip": 0.5, "br": 0.0}
+    assert _parse_accept_encoding("") == {}
+    assert _negotiate_encoding("deflate, br;q=0, gzip;foo=1") == "gzip"
+    assert _negotiate_encoding("*") in ("gzip", "br")
+    assert _negotiate_encoding("*, gzip;q=0, br;q=0") is None
+    assert _negotiate_encoding("identity") is None
+
+
+def test_large_responses_are_compressed(monkeypatch):
+    """Test responses above the size threshold are gzip compressed."""
+    monkeypatch.setattr(generator, "_projects", {"abc12345": make_project(50)})
+    client = TestClient(app)
+
+    response = client.get(
+        "/tools/abc12345/schema/combined",
+        headers={"Accept-Encoding": "gzip"},
+    )
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] in ("gzip", "br")
+    assert len(response.json()["schema"]["openai"]["functions"]) == 50
+
+    raw = client.get("/tools/abc12345", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in raw.headers
+    assert raw.json()["name"] == "weather"
+    assert raw.json()["relative_files"] == ["src/api/main.py"]
+
+    listing = client.get("/tools").json()["tools"]
+    assert [p["project_id"] for p in listing] == ["abc12345"]
+
+
+def test_small_responses_are_not_compressed():
+    """Test responses below the size threshold are sent as is."""
+    client = TestClient(app)
+    response = client.get("/health", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in response.headers
+    assert response.json() == {"status": "healthy"}
+
+
+def test_compression_keeps_message_order():
+    """Test held headers are sent before non-body messages."""
+    async def pathsend_app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.pathsend", "path": "/tmp/file"})
+
+    sent = []
+
+    async def send(message):
+        sent.append(message["type"])
+
+    scope = {"type": "http", "headers": [(b"accept-encoding", b"gzip")]}
+    asyncio.run(CompressionMiddleware(pathsend_app)(scope, None, send))
+    assert sent == ["http.response.start", "http.response.pathsend"]
+
+
+def test_generation_stats_endpoint():
+    """Test policy stats are serialized through the wrapper model."""
+    response = TestClient(app).get("/generate/stats")
+    assert response.status_code == 200
+    assert "policies" in response.json()